@@ -1873,6 +1873,7 @@ class ConfigCache:
             ],
         ] = {}
         self.__is_piggyback_host: dict[HostName, bool] = {}
+        self.__piggybacked_host_files: dict[HostName, Sequence[tuple[str | None, str, int]]] = {}
         self.__snmp_config: dict[tuple[HostName, HostAddress, SourceType], SNMPHostConfig] = {}
         self.__hwsw_inventory_parameters: dict[HostName, HWSWInventoryParameters] = {}
         self.__explicit_host_attributes: dict[HostName, dict[str, str]] = {}
@@ -2105,6 +2106,7 @@ class ConfigCache:
     def invalidate_host_config(self) -> None:
         self.__enforced_services_table.clear()
         self.__is_piggyback_host.clear()
+        self.__piggybacked_host_files.clear()
         self.__snmp_config.clear()
         self.__hwsw_inventory_parameters.clear()
         self.__explicit_host_attributes.clear()
@@ -3221,8 +3223,10 @@ class ConfigCache:
     def _host_has_piggyback_data_right_now(self, host_name: HostAddress) -> bool:
         # This duplicates logic and should be kept in sync with what the fetcher does.
         # Can we somehow instanciate the hypothetical fetcher here, and just let it fetch?
-        time_settings: list[tuple[str | None, str, int]] = self._piggybacked_host_files(host_name)
-        time_settings.append((None, "max_cache_age", piggyback_max_cachefile_age))
+        time_settings: list[tuple[str | None, str, int]] = [
+            *self._piggybacked_host_files(host_name),
+            (None, "max_cache_age", piggyback_max_cachefile_age),
+        ]
         piggy_config = cmk.utils.piggyback_config.Config(host_name, time_settings)
 
         now = time.time()
@@ -3232,10 +3236,16 @@ class ConfigCache:
 
         return any(map(_is_usable, piggyback.get_piggyback_raw_data(host_name)))
 
-    def _piggybacked_host_files(self, host_name: HostName) -> list[tuple[str | None, str, int]]:
-        if rules := self.ruleset_matcher.get_host_values(host_name, piggybacked_host_files):
-            return self._flatten_piggybacked_host_files_rule(host_name, rules[0])
-        return []
+    def _piggybacked_host_files(self, host_name: HostName) -> Sequence[tuple[str | None, str, int]]:
+        def get_piggybacked_host_files() -> Sequence[tuple[str | None, str, int]]:
+            if rules := self.ruleset_matcher.get_host_values(host_name, piggybacked_host_files):
+                return tuple(self._flatten_piggybacked_host_files_rule(host_name, rules[0]))
+            return ()
+
+        with contextlib.suppress(KeyError):
+            return self.__piggybacked_host_files[host_name]
+
+        return self.__piggybacked_host_files.setdefault(host_name, get_piggybacked_host_files())
 
     def _flatten_piggybacked_host_files_rule(
         self, host_name: HostName, rule: Mapping[str, Any]
@@ -3873,11 +3883,16 @@ class ConfigCache:
     def get_piggybacked_hosts_time_settings(
         self, piggybacked_hostname: HostName | None = None
     ) -> Sequence[tuple[str | None, str, int]]:
-        all_sources = piggyback.get_piggybacked_host_with_sources()
+        # Only look at the folder of the requested host: this is called for every
+        # piggybacked host, and reading the meta data of all of them each time adds up.
         used_sources = (
-            {m.source for sources in all_sources.values() for m in sources}
+            {
+                m.source
+                for sources in piggyback.get_piggybacked_host_with_sources().values()
+                for m in sources
+            }
             if piggybacked_hostname is None
-            else {m.source for m in all_sources.get(piggybacked_hostname, [])}
+            else set(piggyback.get_source_hostnames(piggybacked_hostname))
         )
 
         return [
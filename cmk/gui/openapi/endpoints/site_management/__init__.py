@@ -221,7 +221,7 @@ def _serialize_site(site: SiteConfig) -> DomainObject:
         domain_type="site_connection",
         identifier=site.basic_settings.site_id,
         title=site.basic_settings.alias,
-        extensions=dict(site.to_external()),
+        extensions=site.to_dict(),
         editable=True,
         deletable=True,
     )
@@ -5,9 +5,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator, Mapping
+import copy
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Any, cast, Literal
+from pathlib import Path
+from typing import Any, cast, Final, Literal
 
 from livestatus import (
     LocalSocketInfo,
@@ -39,7 +41,7 @@ from cmk.gui.watolib.automations import do_site_login
 from cmk.gui.watolib.changes import add_change
 from cmk.gui.watolib.config_domain_name import ABCConfigDomain
 from cmk.gui.watolib.config_domains import ConfigDomainGUI
-from cmk.gui.watolib.sites import SiteManagementFactory
+from cmk.gui.watolib.sites import SiteManagement, SiteManagementFactory
 
 
 class SiteDoesNotExistException(Exception): ...
@@ -54,7 +56,10 @@ class SiteVersionException(Exception): ...
 class LoginException(Exception): ...
 
 
-@dataclass
+_NETWORK_SOCKET_TYPES: Final = frozenset(("tcp", "tcp6"))
+
+
+@dataclass(slots=True)
 class Socket:
     socket_type: Literal["unix", "tcp6", "tcp", "local"] | None = None
     host: str | None = None
@@ -65,7 +70,7 @@ class Socket:
 
     @classmethod
     def from_external(cls, external_config: dict[str, Any]) -> Socket:
-        if external_config["socket_type"] in ("tcp", "tcp6"):
+        if external_config["socket_type"] in _NETWORK_SOCKET_TYPES:
             if not external_config["encrypted"]:
                 external_config.pop("verify", None)
         return cls(**external_config)
@@ -74,31 +79,39 @@ class Socket:
     def from_internal(
         cls, internal_config: str | UnixSocketInfo | NetworkSocketInfo | LocalSocketInfo
     ) -> Socket:
-        if isinstance(internal_config, str):
-            return cls(socket_type="local")
-
-        if internal_config[0] == "local":
-            return cls(socket_type=internal_config[0])
-
-        if internal_config[0] == "unix":
-            return cls(socket_type=internal_config[0], path=internal_config[1].get("path"))
-
-        host, port = internal_config[1]["address"]
-        encrypt, verify_dict = internal_config[1]["tls"]
-        encrypted = encrypt == "encrypted"
-        verify = verify_dict.get("verify")
-
-        return cls(
-            socket_type=internal_config[0], host=host, port=port, verify=verify, encrypted=encrypted
-        )
-
-    def to_external(self) -> Iterator[tuple[str, str | int | bool]]:
-        for k, v in self.__dict__.items():
-            if v is not None:
-                yield k, v
+        match internal_config:
+            case str() | ("local", _):
+                return cls(socket_type="local")
+            case ("unix", details):
+                return cls(socket_type="unix", path=details.get("path"))
+            case (socket_type, {"address": (host, port), "tls": (encrypt, tls_params)}):
+                return cls(
+                    socket_type=socket_type,
+                    host=host,
+                    port=port,
+                    verify=tls_params.get("verify"),
+                    encrypted=encrypt == "encrypted",
+                )
+        raise ValueError(internal_config)
+
+    def to_dict(self) -> dict[str, str | int | bool]:
+        socket: dict[str, str | int | bool] = {}
+        if self.socket_type is not None:
+            socket["socket_type"] = self.socket_type
+        if self.host is not None:
+            socket["host"] = self.host
+        if self.port is not None:
+            socket["port"] = self.port
+        if self.encrypted is not None:
+            socket["encrypted"] = self.encrypted
+        if self.verify is not None:
+            socket["verify"] = self.verify
+        if self.path is not None:
+            socket["path"] = self.path
+        return socket
 
     def to_internal(self) -> NetworkSocketInfo | UnixSocketInfo | LocalSocketInfo:
-        if self.socket_type in ("tcp", "tcp6"):
+        if self.socket_type in _NETWORK_SOCKET_TYPES:
             if self.host and self.port:
                 tls_params = TLSParams()
 
@@ -127,7 +140,7 @@ class Socket:
         return localsocketinfo
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusHost:
     site: SiteId | None = None
     host: str | None = None
@@ -140,12 +153,10 @@ class StatusHost:
 
         return cls(site=internal_config[0], host=str(internal_config[1]), status_host_set="enabled")
 
-    def to_external(self) -> Iterator[tuple[str, str | bool | None]]:
-        yield "status_host_set", self.status_host_set
-
+    def to_dict(self) -> dict[str, str | None]:
         if self.status_host_set == "enabled":
-            yield "site", self.site
-            yield "host", self.host
+            return {"status_host_set": self.status_host_set, "site": self.site, "host": self.host}
+        return {"status_host_set": self.status_host_set}
 
     def to_internal(self) -> tuple[SiteId, str] | None:
         if self.site and self.host:
@@ -153,16 +164,16 @@ class StatusHost:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Heartbeat:
     interval: int
     timeout: float
 
-    def __iter__(self) -> Iterator[tuple[str, int]]:
-        yield from self.__dict__.items()
+    def to_dict(self) -> dict[str, int | float]:
+        return {"interval": self.interval, "timeout": self.timeout}
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyParams:
     channels: int | None = None
     heartbeat: Heartbeat | None = None
@@ -171,6 +182,18 @@ class ProxyParams:
     connect_retry: float | None = None
     cache: bool | None = None
 
+    @classmethod
+    def from_external(cls, external_config: Mapping[str, Any]) -> ProxyParams:
+        hb = external_config.get("heartbeat")
+        return cls(
+            channels=external_config.get("channels"),
+            heartbeat=Heartbeat(interval=hb["interval"], timeout=hb["timeout"]) if hb else None,
+            channel_timeout=external_config.get("channel_timeout"),
+            query_timeout=external_config.get("query_timeout"),
+            connect_retry=external_config.get("connect_retry"),
+            cache=external_config.get("cache"),
+        )
+
     @classmethod
     def from_internal(cls, internal_config: ProxyConfigParams | None) -> ProxyParams:
         if internal_config is None:
@@ -186,14 +209,21 @@ class ProxyParams:
             cache=internal_config.get("cache"),
         )
 
-    def to_external(self) -> Iterator[tuple[str, dict[str, int] | int | bool | float]]:
-        for k, v in self.__dict__.items():
-            if k == "heartbeat" and self.heartbeat is not None:
-                yield k, dict(self.heartbeat)
-                continue
-
-            if v is not None:
-                yield k, v
+    def to_dict(self) -> dict[str, dict[str, int | float] | int | bool | float]:
+        params: dict[str, dict[str, int | float] | int | bool | float] = {}
+        if self.channels is not None:
+            params["channels"] = self.channels
+        if self.heartbeat is not None:
+            params["heartbeat"] = self.heartbeat.to_dict()
+        if self.channel_timeout is not None:
+            params["channel_timeout"] = self.channel_timeout
+        if self.query_timeout is not None:
+            params["query_timeout"] = self.query_timeout
+        if self.connect_retry is not None:
+            params["connect_retry"] = self.connect_retry
+        if self.cache is not None:
+            params["cache"] = self.cache
+        return params
 
     def to_internal(self) -> ProxyConfigParams:
         proxyconfigparams: ProxyConfigParams = {}
@@ -218,15 +248,24 @@ class ProxyParams:
         return proxyconfigparams
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyTcp:
     port: int | None = None
     only_from: list[str] = field(default_factory=list)
     tls: bool = False
 
-    def to_external(self) -> Iterator[tuple[str, int | list[str] | bool]]:
+    @classmethod
+    def from_internal(cls, internal_config: Mapping[str, Any]) -> ProxyTcp:
+        return cls(
+            port=internal_config.get("port"),
+            only_from=internal_config.get("only_from", []),
+            tls=internal_config.get("tls", False),
+        )
+
+    def to_dict(self) -> dict[str, int | list[str] | bool]:
         if self.port:
-            yield from self.__dict__.items()
+            return {"port": self.port, "only_from": self.only_from, "tls": self.tls}
+        return {}
 
     def to_internal(self) -> ProxyConfigTcp:
         proxyconfigtcp: ProxyConfigTcp = {}
@@ -240,7 +279,7 @@ class ProxyTcp:
         return proxyconfigtcp
 
 
-@dataclass
+@dataclass(slots=True)
 class Proxy:
     direct_or_with_proxy: Literal["with_proxy", "direct"]
     params: ProxyParams | None = None
@@ -254,15 +293,11 @@ class Proxy:
             external_config["global_settings"] if direct_or_with_proxy == "with_proxy" else None
         )
 
-        params = external_config.get("params", {})
-        if heartbeat := params.get("heartbeat"):
-            params["heartbeat"] = Heartbeat(**heartbeat)
-
         return cls(
             direct_or_with_proxy=direct_or_with_proxy,
             global_settings=global_settings,
-            params=ProxyParams(**params),
-            tcp=ProxyTcp(**external_config.get("tcp", {})),
+            params=ProxyParams.from_external(external_config.get("params", {})),
+            tcp=ProxyTcp.from_internal(external_config.get("tcp", {})),
         )
 
     @classmethod
@@ -278,22 +313,26 @@ class Proxy:
             direct_or_with_proxy=direct_or_with_proxy,
             global_settings=bool(internal_config.get("params") is None),
             params=ProxyParams.from_internal(internal_config.get("params", {})),
-            tcp=ProxyTcp(**internal_config.get("tcp", {})),
+            tcp=ProxyTcp.from_internal(internal_config.get("tcp", {})),
         )
 
-    def to_external(self) -> Iterator[tuple[str, str | bool | None | dict]]:
-        yield "use_livestatus_daemon", self.direct_or_with_proxy
+    def to_dict(self) -> dict[str, str | bool | None | dict]:
+        proxy: dict[str, str | bool | None | dict] = {
+            "use_livestatus_daemon": self.direct_or_with_proxy
+        }
 
         if self.direct_or_with_proxy == "with_proxy":
-            yield "global_settings", self.global_settings
+            proxy["global_settings"] = self.global_settings
 
             if self.params:
-                if paramsdict := dict(self.params.to_external()):
-                    yield "params", paramsdict
+                if paramsdict := self.params.to_dict():
+                    proxy["params"] = paramsdict
 
             if self.tcp:
-                if tcpdict := dict(self.tcp.to_external()):
-                    yield "tcp", tcpdict
+                if tcpdict := self.tcp.to_dict():
+                    proxy["tcp"] = tcpdict
+
+        return proxy
 
     def to_internal(self) -> ProxyConfig | None:
         if self.direct_or_with_proxy == "direct":
@@ -317,7 +356,7 @@ class Proxy:
         return proxyconfig
 
 
-@dataclass
+@dataclass(slots=True)
 class BasicSettings:
     alias: str
     site_id: str
@@ -333,21 +372,20 @@ class BasicSettings:
             )
         return cls(alias=internal_config["alias"], site_id=site_id)
 
-    def to_external(self) -> Iterator[tuple[str, str]]:
-        yield "alias", self.alias
-        yield "site_id", self.site_id
+    def to_dict(self) -> dict[str, str]:
+        basic_settings = {"alias": self.alias, "site_id": self.site_id}
         if version.edition() is version.Edition.CME and self.customer is not None:
-            yield "customer", self.customer
+            basic_settings["customer"] = self.customer
+        return basic_settings
 
-    def to_internal(self) -> SiteConfiguration:
-        configid: SiteConfiguration = {"alias": self.alias, "id": SiteId(self.site_id)}
+    def fill_internal(self, internal_config: SiteConfiguration) -> None:
+        internal_config["alias"] = self.alias
+        internal_config["id"] = SiteId(self.site_id)
         if version.edition() is version.Edition.CME and self.customer is not None:
-            configid["customer"] = self.customer
-
-        return configid
+            internal_config["customer"] = self.customer
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusConnection:
     connection: Socket
     proxy: Proxy
@@ -383,54 +421,48 @@ class StatusConnection:
             disable_in_status_gui=external_config["disable_in_status_gui"],
         )
 
-    def to_external(self) -> Iterator[tuple[str, dict | bool | int]]:
-        for k, v in self.__dict__.items():
-            if k == "status_host":
-                yield k, dict(self.status_host.to_external())
-                continue
-
-            if k == "connection":
-                yield k, dict(self.connection.to_external())
-                continue
-
-            if k == "proxy":
-                yield k, dict(self.proxy.to_external())
-                continue
-
-            yield k, v
-
-    def to_internal(self) -> SiteConfiguration:
-        statusconnection: SiteConfiguration = {
-            "status_host": self.status_host.to_internal(),
-            "socket": self.connection.to_internal(),
-            "proxy": self.proxy.to_internal(),
-            "disabled": self.disable_in_status_gui,
-            "timeout": self.connect_timeout,
-            "persist": self.persistent_connection,
+    def to_dict(self) -> dict[str, dict | bool | int | str]:
+        return {
+            "connection": self.connection.to_dict(),
+            "proxy": self.proxy.to_dict(),
+            "connect_timeout": self.connect_timeout,
+            "persistent_connection": self.persistent_connection,
             "url_prefix": self.url_prefix,
+            "status_host": self.status_host.to_dict(),
+            "disable_in_status_gui": self.disable_in_status_gui,
         }
-        return statusconnection
+
+    def fill_internal(self, internal_config: SiteConfiguration) -> None:
+        internal_config["status_host"] = self.status_host.to_internal()
+        internal_config["socket"] = self.connection.to_internal()
+        internal_config["proxy"] = self.proxy.to_internal()
+        internal_config["disabled"] = self.disable_in_status_gui
+        internal_config["timeout"] = self.connect_timeout
+        internal_config["persist"] = self.persistent_connection
+        internal_config["url_prefix"] = self.url_prefix
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSync:
     sync_with_ldap_connections: str
     ldap_connections: list[str] = field(default_factory=list)
 
     @classmethod
     def from_internal(cls, internal_config: tuple | str | None) -> UserSync:
-        if isinstance(internal_config, tuple):
-            return cls(sync_with_ldap_connections="ldap", ldap_connections=internal_config[1])
-
-        if internal_config == "all":
-            return cls(sync_with_ldap_connections="all")
-
+        match internal_config:
+            case "all":
+                return cls(sync_with_ldap_connections="all")
+            case (_, ldap_connections):
+                return cls(sync_with_ldap_connections="ldap", ldap_connections=ldap_connections)
         return cls(sync_with_ldap_connections="disabled")
 
-    def to_external(self) -> Iterator[tuple[str, str | None | list[str]]]:
-        yield "sync_with_ldap_connections", self.sync_with_ldap_connections
+    def to_dict(self) -> dict[str, str | list[str]]:
         if self.ldap_connections:
-            yield "ldap_connections", self.ldap_connections
+            return {
+                "sync_with_ldap_connections": self.sync_with_ldap_connections,
+                "ldap_connections": self.ldap_connections,
+            }
+        return {"sync_with_ldap_connections": self.sync_with_ldap_connections}
 
     def to_internal(self) -> Literal["all"] | tuple[Literal["list"], list[str]] | None:
         if self.sync_with_ldap_connections == "all":
@@ -442,7 +474,7 @@ class UserSync:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigurationConnection:
     enable_replication: bool
     url_of_remote_site: str
@@ -477,29 +509,30 @@ class ConfigurationConnection:
         external_config["user_sync"] = UserSync(**external_config["user_sync"])
         return cls(**external_config)
 
-    def to_external(self) -> Iterator[tuple[str, dict[str, str | list[str] | None] | bool | str]]:
-        for k, v in self.__dict__.items():
-            if k == "user_sync":
-                yield k, dict(self.user_sync.to_external())
-                continue
-
-            yield k, v
-
-    def to_internal(self) -> SiteConfiguration:
-        configconnection: SiteConfiguration = {
-            "replication": "slave" if self.enable_replication else None,
-            "multisiteurl": self.url_of_remote_site,
-            "disable_wato": self.disable_remote_configuration,
-            "insecure": self.ignore_tls_errors,
-            "user_login": self.direct_login_to_web_gui_allowed,
-            "user_sync": self.user_sync.to_internal(),
-            "replicate_ec": self.replicate_event_console,
-            "replicate_mkps": self.replicate_extensions,
+    def to_dict(self) -> dict[str, dict[str, str | list[str]] | bool | str]:
+        return {
+            "enable_replication": self.enable_replication,
+            "url_of_remote_site": self.url_of_remote_site,
+            "disable_remote_configuration": self.disable_remote_configuration,
+            "ignore_tls_errors": self.ignore_tls_errors,
+            "direct_login_to_web_gui_allowed": self.direct_login_to_web_gui_allowed,
+            "user_sync": self.user_sync.to_dict(),
+            "replicate_event_console": self.replicate_event_console,
+            "replicate_extensions": self.replicate_extensions,
         }
-        return configconnection
+
+    def fill_internal(self, internal_config: SiteConfiguration) -> None:
+        internal_config["replication"] = "slave" if self.enable_replication else None
+        internal_config["multisiteurl"] = self.url_of_remote_site
+        internal_config["disable_wato"] = self.disable_remote_configuration
+        internal_config["insecure"] = self.ignore_tls_errors
+        internal_config["user_login"] = self.direct_login_to_web_gui_allowed
+        internal_config["user_sync"] = self.user_sync.to_internal()
+        internal_config["replicate_ec"] = self.replicate_event_console
+        internal_config["replicate_mkps"] = self.replicate_extensions
 
 
-@dataclass
+@dataclass(slots=True)
 class SiteConfig:
     basic_settings: BasicSettings
     status_connection: StatusConnection
@@ -528,28 +561,55 @@ class SiteConfig:
             secret=external_config.get("secret"),
         )
 
-    def to_external(self) -> Iterator[tuple[str, dict | None | str]]:
-        yield "basic_settings", dict(self.basic_settings.to_external())
-        yield "status_connection", dict(self.status_connection.to_external())
-        yield "configuration_connection", dict(self.configuration_connection.to_external())
+    def to_dict(self) -> dict[str, dict | str]:
+        site_config: dict[str, dict | str] = {
+            "basic_settings": self.basic_settings.to_dict(),
+            "status_connection": self.status_connection.to_dict(),
+            "configuration_connection": self.configuration_connection.to_dict(),
+        }
         if self.secret:
-            yield "secret", self.secret
+            site_config["secret"] = self.secret
+        return site_config
 
     def to_internal(self) -> SiteConfiguration:
-        internal_config: SiteConfiguration = (
-            self.basic_settings.to_internal()
-            | self.status_connection.to_internal()
-            | self.configuration_connection.to_internal()
-        )
+        internal_config: SiteConfiguration = {}
+        self.basic_settings.fill_internal(internal_config)
+        self.status_connection.fill_internal(internal_config)
+        self.configuration_connection.fill_internal(internal_config)
         if self.secret:
             internal_config["secret"] = self.secret
         return internal_config
 
 
+# Holds at most one entry: the raw content of the last parsed sites.mk, keyed by its path,
+# mtime and size. The defaults for an empty configuration are request dependent (e.g. the
+# translated alias of the local site), so they are applied after taking the entry from here.
+_SITES_CACHE: dict[tuple[Path, int, int], SiteConfigurations] = {}
+
+
+def _load_sites_cached(site_mgmt: SiteManagement) -> SiteConfigurations:
+    """Load the site configurations, reusing the parsed sites.mk as long as it is unchanged
+
+    The stat based key also makes changes written by other processes invalidate the cache.
+    Callers get a copy, so they are free to modify it before saving."""
+    path = site_mgmt.sites_mk_path()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        _SITES_CACHE.clear()
+        return site_mgmt.load_sites()
+
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if (raw_sites := _SITES_CACHE.get(key)) is None:
+        _SITES_CACHE.clear()
+        raw_sites = _SITES_CACHE.setdefault(key, site_mgmt.load_raw_sites())
+    return prepare_raw_site_config(copy.deepcopy(raw_sites))
+
+
 class SitesApiMgr:
     def __init__(self) -> None:
         self.site_mgmt = SiteManagementFactory().factory()
-        self.all_sites = self.site_mgmt.load_sites()
+        self.all_sites = _load_sites_cached(self.site_mgmt)
 
     def get_all_sites(self) -> SiteConfigurations:
         return self.all_sites
@@ -560,9 +620,11 @@ class SitesApiMgr:
         return existing_site
 
     def delete_a_site(self, site_id: SiteId) -> None:
-        if self.all_sites.get(site_id):
-            self.site_mgmt.delete_site(site_id)
-        raise SiteDoesNotExistException
+        if site_id not in self.all_sites:
+            raise SiteDoesNotExistException
+        self.site_mgmt.delete_site(site_id)
+        del self.all_sites[site_id]
+        _SITES_CACHE.clear()
 
     def login_to_site(self, site_id: SiteId, username: str, password: str) -> None:
         site = self.get_a_site(site_id)
@@ -572,18 +634,21 @@ class SitesApiMgr:
             raise LoginException(str(exc))
 
         self.site_mgmt.save_sites(self.all_sites)
+        _SITES_CACHE.clear()
 
     def logout_of_site(self, site_id: SiteId) -> None:
         site = self.get_a_site(site_id)
         if "secret" in site:
             del site["secret"]
             self.site_mgmt.save_sites(self.all_sites)
+            _SITES_CACHE.clear()
 
     def validate_and_save_site(self, site_id: SiteId, site_config: SiteConfiguration) -> None:
         self.site_mgmt.validate_configuration(site_id, site_config, self.all_sites)
         sites = prepare_raw_site_config(SiteConfigurations({site_id: site_config}))
         self.all_sites.update(sites)
         self.site_mgmt.save_sites(self.all_sites)
+        _SITES_CACHE.clear()
 
 
 def add_changes_after_editing_site_connection(
@@ -62,25 +62,36 @@ from cmk.gui.watolib.simple_config_file import ConfigFileRegistry, WatoSingleCon
 from cmk.gui.watolib.utils import ldap_connections_are_configurable
 
 
+def _sites_mk_path() -> Path:
+    return Path(cmk.utils.paths.default_config_dir + "/multisite.d/sites.mk")
+
+
 class SitesConfigFile(WatoSingleConfigFile[SiteConfigurations]):
     def __init__(self) -> None:
         super().__init__(
-            config_file_path=Path(cmk.utils.paths.default_config_dir + "/multisite.d/sites.mk"),
+            config_file_path=_sites_mk_path(),
             config_variable="sites",
             spec_class=SiteConfigurations,
         )
 
-    def _load_file(self, lock: bool) -> SiteConfigurations:
-        if not self._config_file_path.exists():
-            return default_single_site_configuration()
+    def load_raw_for_reading(self) -> SiteConfigurations:
+        """The sites as written in the file, without defaults for an empty configuration"""
+        return self._load_raw_file(lock=False)
 
-        sites_from_file = store.load_from_mk_file(
+    def _load_raw_file(self, lock: bool) -> SiteConfigurations:
+        return store.load_from_mk_file(
             self._config_file_path,
             key=self._config_variable,
             default={},
             lock=lock,
         )
 
+    def _load_file(self, lock: bool) -> SiteConfigurations:
+        if not self._config_file_path.exists():
+            return default_single_site_configuration()
+
+        sites_from_file = self._load_raw_file(lock)
+
         if not sites_from_file:
             return default_single_site_configuration()
 
@@ -338,10 +349,18 @@ class SiteManagement:
             user_sync_valuespec = cls.user_sync_valuespec(site_id)
             user_sync_valuespec.validate_value(site_configuration.get("user_sync"), "user_sync")
 
+    @classmethod
+    def sites_mk_path(cls) -> Path:
+        return _sites_mk_path()
+
     @classmethod
     def load_sites(cls) -> SiteConfigurations:
         return SitesConfigFile().load_for_reading()
 
+    @classmethod
+    def load_raw_sites(cls) -> SiteConfigurations:
+        return SitesConfigFile().load_raw_for_reading()
+
     @classmethod
     def save_sites(cls, sites: SiteConfigurations, activate: bool = True) -> None:
         # TODO: Clean this up
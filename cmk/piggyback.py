@@ -102,6 +102,14 @@ def get_piggybacked_host_with_sources() -> Mapping[HostAddress, Sequence[Piggyba
     }
 
 
+def get_source_hostnames(piggybacked_hostname: HostAddress) -> Sequence[HostName]:
+    """Returns the source hosts that provided piggyback data for the given host"""
+    return [
+        HostName(payload_file.name)
+        for payload_file in _files_in(piggyback_dir / Path(piggybacked_hostname))
+    ]
+
+
 def _remove_piggyback_file(piggyback_file_path: Path) -> bool:
     try:
         piggyback_file_path.unlink()
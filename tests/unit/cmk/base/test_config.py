@@ -46,6 +46,7 @@ from cmk.base.api.agent_based.plugin_classes import SNMPSectionPlugin
 from cmk.base.config import ConfigCache, ConfiguredIPLookup, handle_ip_lookup_failure
 from cmk.base.ip_lookup import IPStackConfig
 
+from cmk import piggyback
 from cmk.agent_based.v1 import HostLabel
 
 
@@ -481,6 +482,58 @@ def test_is_piggyback_host_auto(
     assert config_cache.is_piggyback_host(hostname) == result
 
 
+def test_get_piggybacked_hosts_time_settings_of_piggybacked_host(monkeypatch: MonkeyPatch) -> None:
+    ts = Scenario()
+    for source in ("source1", "source2", "source3"):
+        ts.add_host(HostName(source))
+    ts.set_ruleset(
+        "piggybacked_host_files",
+        [
+            {
+                "id": f"0{age}",
+                "condition": {"host_name": [HostName(f"source{age}")]},
+                "value": {"global_max_cache_age": age},
+            }
+            for age in (1, 2, 3)
+        ],
+    )
+    config_cache = ts.apply(monkeypatch)
+
+    get_host_values_calls: list[HostName] = []
+    get_host_values = config_cache.ruleset_matcher.get_host_values
+
+    def _counting_get_host_values(
+        hostname: HostName, ruleset: Sequence[RuleSpec[Any]]
+    ) -> Sequence[Any]:
+        get_host_values_calls.append(hostname)
+        return get_host_values(hostname, ruleset)
+
+    monkeypatch.setattr(config_cache.ruleset_matcher, "get_host_values", _counting_get_host_values)
+
+    piggybacked = HostName("piggybacked")
+    piggyback.store_piggyback_raw_data(
+        HostName("source1"), {piggybacked: (b"line",)}, timestamp=1640000000.0
+    )
+    piggyback.store_piggyback_raw_data(
+        HostName("source2"),
+        {piggybacked: (b"line",), HostName("other"): (b"line",)},
+        timestamp=1640000000.0,
+    )
+    piggyback.store_piggyback_raw_data(
+        HostName("source3"), {HostName("other"): (b"line",)}, timestamp=1640000000.0
+    )
+
+    expected = [
+        (HostName("source1"), "max_cache_age", 1),
+        (HostName("source2"), "max_cache_age", 2),
+        (None, "max_cache_age", config.piggyback_max_cachefile_age),
+    ]
+    assert config_cache.get_piggybacked_hosts_time_settings(piggybacked) == expected
+    # the rules of the sources are only evaluated once
+    assert config_cache.get_piggybacked_hosts_time_settings(piggybacked) == expected
+    assert sorted(get_host_values_calls) == [HostName("source1"), HostName("source2")]
+
+
 @pytest.mark.parametrize(
     "hostname, tags, result",
     [
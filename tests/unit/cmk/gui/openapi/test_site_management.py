@@ -128,6 +128,11 @@ def test_delete_site_connection(clients: ClientRegistry) -> None:
     config, site_id = _default_config_with_site_id()
     clients.SiteManagement.create(site_config=config)
     clients.SiteManagement.delete(site_id=site_id)
+    clients.SiteManagement.get(site_id=site_id, expect_ok=False).assert_status_code(404)
+
+
+def test_delete_site_connection_that_doesnt_exist(clients: ClientRegistry) -> None:
+    clients.SiteManagement.delete(site_id="NO_EXIST_SITE")
 
 
 def test_delete_site_connection_problem(
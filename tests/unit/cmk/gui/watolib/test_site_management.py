@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# Copyright (C) 2024 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# pylint: disable=protected-access
+
+from collections.abc import Callable, Iterator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from livestatus import SiteConfiguration, SiteConfigurations, SiteId
+
+from cmk.gui.config import default_single_site_configuration
+from cmk.gui.watolib import site_management
+from cmk.gui.watolib.site_management import SiteDoesNotExistException, SitesApiMgr
+from cmk.gui.watolib.sites import SiteManagement, SitesConfigFile
+
+_REMOTE_SITE = SiteId("remote")
+
+
+def _sites(alias: str = "Remote site") -> SiteConfigurations:
+    return SiteConfigurations(
+        {
+            _REMOTE_SITE: SiteConfiguration(
+                {
+                    "alias": alias,
+                    "socket": ("local", None),
+                    "secret": "the-secret",
+                }
+            )
+        }
+    )
+
+
+def _write_sites_mk(sites: SiteConfigurations) -> None:
+    SitesConfigFile().save(sites)
+
+
+@pytest.fixture(autouse=True)
+def clear_sites_cache() -> Iterator[None]:
+    site_management._SITES_CACHE.clear()
+    yield
+    site_management._SITES_CACHE.clear()
+
+
+@pytest.mark.usefixtures("request_context")
+def test_sites_api_mgr_loads_unchanged_sites_mk_once(mocker: MockerFixture) -> None:
+    _write_sites_mk(_sites())
+    load_raw_sites = mocker.spy(SiteManagement, "load_raw_sites")
+
+    assert SitesApiMgr().get_all_sites() == _sites()
+    assert SitesApiMgr().get_all_sites() == _sites()
+
+    assert load_raw_sites.call_count == 1
+
+
+@pytest.mark.usefixtures("request_context")
+def test_sites_api_mgr_reloads_rewritten_sites_mk() -> None:
+    _write_sites_mk(_sites())
+    assert SitesApiMgr().get_all_sites() == _sites()
+
+    _write_sites_mk(_sites(alias="Remote site, renamed by another process"))
+
+    assert SitesApiMgr().get_all_sites() == _sites(alias="Remote site, renamed by another process")
+
+
+@pytest.mark.usefixtures("request_context")
+def test_sites_api_mgr_modifications_do_not_leak_into_cache() -> None:
+    _write_sites_mk(_sites())
+    modified = SitesApiMgr().get_all_sites()
+    modified[_REMOTE_SITE]["alias"] = "Modified"
+    del modified[_REMOTE_SITE]["secret"]
+
+    assert SitesApiMgr().get_all_sites() == _sites()
+
+
+@pytest.mark.usefixtures("request_context")
+def test_sites_api_mgr_does_not_cache_default_configuration() -> None:
+    _write_sites_mk(SiteConfigurations({}))
+
+    assert SitesApiMgr().get_all_sites() == default_single_site_configuration()
+    assert list(site_management._SITES_CACHE.values()) == [{}]
+
+
+@pytest.mark.parametrize(
+    "modify_sites",
+    [
+        pytest.param(
+            lambda mgr: mgr.validate_and_save_site(_REMOTE_SITE, _sites("New alias")[_REMOTE_SITE]),
+            id="validate_and_save_site",
+        ),
+        pytest.param(
+            lambda mgr: mgr.login_to_site(_REMOTE_SITE, "cmkadmin", "cmk"),
+            id="login_to_site",
+        ),
+        pytest.param(lambda mgr: mgr.logout_of_site(_REMOTE_SITE), id="logout_of_site"),
+        pytest.param(lambda mgr: mgr.delete_a_site(_REMOTE_SITE), id="delete_a_site"),
+    ],
+)
+@pytest.mark.usefixtures("request_context")
+def test_sites_api_mgr_modifications_invalidate_cache(
+    mocker: MockerFixture, modify_sites: Callable[[SitesApiMgr], None]
+) -> None:
+    mocker.patch(
+        "cmk.gui.watolib.site_management.do_site_login",
+        return_value="new-secret",
+    )
+    _write_sites_mk(_sites())
+    mgr = SitesApiMgr()
+    mocker.patch.object(mgr, "site_mgmt")
+    assert site_management._SITES_CACHE
+
+    modify_sites(mgr)
+
+    assert not site_management._SITES_CACHE
+
+
+@pytest.mark.usefixtures("request_context")
+def test_delete_a_site(mocker: MockerFixture) -> None:
+    _write_sites_mk(_sites())
+    mgr = SitesApiMgr()
+    site_mgmt = mocker.patch.object(mgr, "site_mgmt")
+
+    mgr.delete_a_site(_REMOTE_SITE)
+
+    site_mgmt.delete_site.assert_called_once_with(_REMOTE_SITE)
+    assert _REMOTE_SITE not in mgr.all_sites
+
+
+@pytest.mark.usefixtures("request_context")
+def test_delete_a_site_that_doesnt_exist(mocker: MockerFixture) -> None:
+    _write_sites_mk(_sites())
+    mgr = SitesApiMgr()
+    site_mgmt = mocker.patch.object(mgr, "site_mgmt")
+
+    with pytest.raises(SiteDoesNotExistException):
+        mgr.delete_a_site(SiteId("unknown"))
+
+    site_mgmt.delete_site.assert_not_called()
+    assert mgr.all_sites == _sites()
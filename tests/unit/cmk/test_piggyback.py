@@ -153,3 +153,24 @@ def test_get_source_and_piggyback_hosts() -> None:
             ),
         ],
     }
+
+
+def test_get_source_hostnames() -> None:
+    piggyback.store_piggyback_raw_data(
+        HostAddress("source1"), {HostAddress("test-host"): _PAYLOAD}, _REF_TIME
+    )
+    piggyback.store_piggyback_raw_data(
+        HostAddress("source2"),
+        {
+            HostAddress("test-host"): _PAYLOAD,
+            HostAddress("test-host2"): _PAYLOAD,
+        },
+        _REF_TIME,
+    )
+
+    assert piggyback.get_source_hostnames(HostAddress("test-host")) == [
+        HostAddress("source1"),
+        HostAddress("source2"),
+    ]
+    assert piggyback.get_source_hostnames(HostAddress("test-host2")) == [HostAddress("source2")]
+    assert not piggyback.get_source_hostnames(HostAddress("no-host"))